@@ -12,7 +12,6 @@
 import awscli.clidriver
 import sys
 import logging
-import copy
 
 LOG = logging.getLogger(__name__)
 
@@ -109,21 +108,29 @@ class Completer(object):
         return names
 
     def _find_possible_options(self, current_arg, opts, subcmd_help=None):
-        all_options = copy.copy(self.main_options)
+        all_options = self.main_options
         if subcmd_help is not None:
-            all_options += self._get_documented_completions(
+            all_options = all_options + self._get_documented_completions(
                 subcmd_help.arg_table)
 
+        # Look through list of options on cmdline. If there are
+        # options that have already been specified and they are
+        # not the current word, remove them from list of possibles.
+        # Each use only removes one match, so an operation argument that
+        # shares its name with a global option can still be offered.
+        used_options = {}
         for option in opts:
-            # Look through list of options on cmdline. If there are
-            # options that have already been specified and they are
-            # not the current word, remove them from list of possibles.
             if option != current_arg:
                 stripped_opt = option.lstrip('-')
-                if stripped_opt in all_options:
-                    all_options.remove(stripped_opt)
+                used_options[stripped_opt] = used_options.get(
+                    stripped_opt, 0) + 1
         cw = current_arg.lstrip('-')
-        possibilities = ['--' + n for n in all_options if n.startswith(cw)]
+        possibilities = []
+        for name in all_options:
+            if used_options.get(name):
+                used_options[name] -= 1
+            elif name.startswith(cw):
+                possibilities.append('--' + name)
         if len(possibilities) == 1 and possibilities[0] == current_arg:
             return self._complete_option(possibilities[0])
         return possibilities
@@ -135,6 +135,16 @@ class TestCompleter(BaseCompleterTest):
             self.clidriver_creator.create_clidriver(commands))
         self.assert_completion(completer, 'aws --foo --f', [])
 
+    def test_used_top_level_arg_is_offered_on_next_completion(self):
+        commands = {
+            'subcommands': {},
+            'arguments': ['foo', 'bar']
+        }
+        completer = Completer(
+            self.clidriver_creator.create_clidriver(commands))
+        self.assert_completion(completer, 'aws --foo --', ['--bar'])
+        self.assert_completion(completer, 'aws --', ['--foo', '--bar'])
+
     def test_complete_service_commands(self):
         commands = {
             'subcommands': {
@@ -257,6 +267,22 @@ class TestCompleter(BaseCompleterTest):
             self.clidriver_creator.create_clidriver(commands))
         self.assert_completion(completer, 'aws foo bar --baz --b', [])
 
+    def test_complete_operation_arg_sharing_name_with_global_arg(self):
+        commands = {
+            'subcommands': {
+                'foo': {'subcommands': {
+                    'bar': {'arguments': ['baz', 'bin']}
+                }}
+            },
+            'arguments': ['baz']
+        }
+        completer = Completer(
+            self.clidriver_creator.create_clidriver(commands))
+        self.assert_completion(completer, 'aws foo bar --baz --',
+                               ['--baz', '--bin'])
+        self.assert_completion(completer, 'aws foo bar --baz --baz --',
+                               ['--bin'])
+
     def test_complete_positional_argument(self):
         commands = {
             'subcommands': {